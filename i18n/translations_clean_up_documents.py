@@ -8,36 +8,33 @@ translated words.
 """
 import sys
 import re
-
-
-def remove_front_matter(content: str) -> str:
-    """Removes front matter from markdown content"""
-    return re.sub(r"^---\n(.*?)\n---", "", content, flags=re.S)
-
-
-def remove_markdown_images(content: str) -> str:
-    """Removes lines with markdown image tags from the content"""
-    return re.sub(r"\!\[.*?\]\(.*?\)\n?", "", content)
-
-
-def remove_hash_marks(content: str) -> str:
-    """Removes hash marks from the content"""
-    return re.sub("^#+ ", "", content, flags=re.M)
-
-
-def remove_templates(content: str) -> str:
-    """Removes markdown templates from the content"""
-    return re.sub("\{\%.*\%\}", "", content)
-
-
-def remove_list_items(content: str) -> str:
-    """Removes list items from the content"""
-    return re.sub("^(\d+\.)|(-) ", "", content, flags=re.M)
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Markdown syntax to delete from the document, matched in a single pass. In
+# order: front matter, image tags, heading hash marks (with an optional
+# numbered prefix), templates, and list item markers.
+RE_MARKUP = re.compile(
+    r"(?s:\A---\n.*?\n---)"
+    r"|\!\[.*?\]\(.*?\)\n?"
+    r"|^#+ (?:\d+\.)?"
+    r"|\{\%.*\%\}"
+    r"|^\d+\.|- ",
+    flags=re.M,
+)
+RE_LINE_RETURNS = re.compile(r"\n\n+")
+RE_CODE_BLOCK = re.compile(r"```([a-z]*)\n(.*?)```", flags=re.S)
+
+
+def remove_markup(content: str) -> str:
+    """Removes front matter, images, hash marks, templates, and list items from
+    the content"""
+    return RE_MARKUP.sub("", content)
 
 
 def merge_line_returns(content: str) -> str:
     """Merges line returns into a single line"""
-    return re.sub("\n\n+", "\n\n", content)
+    return RE_LINE_RETURNS.sub("\n\n", content)
 
 
 def filter_out_code(content: str) -> str:
@@ -47,22 +44,22 @@ def filter_out_code(content: str) -> str:
         lines = match.group(2).split("\n")
         return "\n".join([line for line in lines if "# " in line])
 
-    return re.sub("```([a-z]*)\n(.*?)```", filter_code_comments, content, flags=re.S)
+    return RE_CODE_BLOCK.sub(filter_code_comments, content)
+
+
+def clean_up_document(filepath: str) -> str:
+    """Reads a markdown file and returns its text without code or markup"""
+    content = filter_out_code(Path(filepath).read_text())
+    content = remove_markup(content)
+    content = merge_line_returns(content)
+    return content.strip()
 
 
 def main():
     filepaths = [arg for arg in sys.argv if arg.endswith(".md")]
-    for filepath in filepaths:
-        with open(filepath, "r") as md_file:
-            content = md_file.read()
-            content = remove_front_matter(content)
-            content = filter_out_code(content)
-            content = remove_markdown_images(content)
-            content = remove_hash_marks(content)
-            content = remove_list_items(content)
-            content = remove_templates(content)
-            content = merge_line_returns(content)
-            print(content.strip())
+    with ProcessPoolExecutor() as executor:
+        for content in executor.map(clean_up_document, filepaths, chunksize=8):
+            print(content)
 
 
 if __name__ == "__main__":
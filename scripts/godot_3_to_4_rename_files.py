@@ -14,9 +14,22 @@ import os
 import re
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
+EXCLUDES = ("addons", ".godot", ".git")
+RESOURCE_SUFFIXES = frozenset([".tscn", ".tres"])
+
+REGEX_PATH_ATTRIBUTE = re.compile(r'path="([^"]*)"')
+REGEX_GDSCRIPT_FILE_PATH = re.compile(r'"res://([^"]*)"')
+REGEX_GDSCRIPT_PRELOAD = re.compile(r'preload\("([^"]*)"')
+REGEX_AUTOLOAD_FILE_PATH_STRING = re.compile(r'="\*?(res://[^"]*)"')
+
+REGEX_NUMBER_AFTER_WORD = re.compile(r"(\w)(\d+[a-zA-Z])")
+REGEX_CAPITALIZED_WORD = re.compile(r"(.)(?<!_)([A-Z][a-z]+)")
+REGEX_LOWER_TO_UPPER = re.compile(r"([a-z])(?<!_)([A-Z])")
+
 
 @dataclass
 class Config:
@@ -54,13 +67,14 @@ def parse_args() -> Config:
     )
 
 
+@lru_cache(maxsize=None)
 def to_snake_case(name: str) -> str:
     parts = name.split("/")
     converted_parts = []
     for part in parts:
-        step_1 = re.sub(r"(\w)(\d+[a-zA-Z])", r"\1_\2", part)
-        step_2 = re.sub(r"(.)(?<!_)([A-Z][a-z]+)", r"\1_\2", step_1)
-        step_3 = re.sub(r"([a-z])(?<!_)([A-Z])", r"\1_\2", step_2)
+        step_1 = REGEX_NUMBER_AFTER_WORD.sub(r"\1_\2", part)
+        step_2 = REGEX_CAPITALIZED_WORD.sub(r"\1_\2", step_1)
+        step_3 = REGEX_LOWER_TO_UPPER.sub(r"\1_\2", step_2)
         converted_parts.append(step_3.lower())
     return "/".join(converted_parts)
 
@@ -68,49 +82,44 @@ def to_snake_case(name: str) -> str:
 def update_file_content(
     file_path: Path, config: Config, regex_patterns: list[re.Pattern]
 ) -> None:
-    with open(file_path, "r") as file:
+    with open(file_path, "r" if config.dry_run else "r+") as file:
         content = file.read()
 
-    updated_content = content
-    modified_attributes = []
+        updated_content = content
+        modified_attributes = []
 
-    for regex_pattern in regex_patterns:
-        updated_content = regex_pattern.sub(
-            lambda m: m.group(0).replace(m.group(1), to_snake_case(m.group(1))),
-            updated_content,
-        )
-        if config.dry_run:
-            modified_attributes.extend(regex_pattern.findall(updated_content))
+        for regex_pattern in regex_patterns:
+            updated_content = regex_pattern.sub(
+                lambda m: m.group(0).replace(m.group(1), to_snake_case(m.group(1))),
+                updated_content,
+            )
+            if config.dry_run:
+                modified_attributes.extend(regex_pattern.findall(updated_content))
 
-    if config.dry_run:
-        print(f"Modified attributes: {modified_attributes}")
-    else:
-        with open(file_path, "w") as file:
+        if config.dry_run:
+            print(f"Modified attributes: {modified_attributes}")
+        elif updated_content != content:
+            file.seek(0)
+            file.truncate()
             file.write(updated_content)
 
 
 def rename_files_and_folders(path: Path, config: Config) -> None:
-    EXCLUDES = ["addons", ".godot", ".git"]
     if any(exclude in str(path) for exclude in EXCLUDES):
         return
 
-    regex_path_attribute = re.compile(r'path="([^"]*)"')
-    regex_gdscript_file_path = re.compile(r'"res://([^"]*)"')
-    regex_gdscript_preload = re.compile(r'preload\("([^"]*)"')
-    regex_autoload_file_path_string = re.compile(r'="\*?(res://[^"]*)"')
-
     for path_current in path.iterdir():
         if path_current.is_dir():
             rename_files_and_folders(path_current, config)
 
-        if path_current.suffix in [".tscn", ".tres"]:
-            update_file_content(path_current, config, [regex_path_attribute])
+        if path_current.suffix in RESOURCE_SUFFIXES:
+            update_file_content(path_current, config, [REGEX_PATH_ATTRIBUTE])
         elif path_current.suffix == ".gd":
             update_file_content(
-                path_current, config, [regex_gdscript_file_path, regex_gdscript_preload]
+                path_current, config, [REGEX_GDSCRIPT_FILE_PATH, REGEX_GDSCRIPT_PRELOAD]
             )
         elif path_current.name == "project.godot":
-            update_file_content(path_current, config, [regex_autoload_file_path_string])
+            update_file_content(path_current, config, [REGEX_AUTOLOAD_FILE_PATH_STRING])
 
         path_new = path_current.with_name(to_snake_case(path_current.name))
         if path_current != path_new: